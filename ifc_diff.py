@@ -22,45 +22,215 @@
 
 """Diffing tool for NativeIFC project objects"""
 
+import functools
+import io
+import mmap
 import os
-import difflib
+import re
 import FreeCADGui
 import ifcopenshell
+from PySide import QtCore, QtGui
 
+try:
+    # optional C implementation, much faster on large files
+    from cdifflib import CSequenceMatcher as SequenceMatcher
+except ImportError:
+    from difflib import SequenceMatcher
 
-def get_diff(proj):
+# html (prefix, suffix) to wrap diff lines with, by first character
+WRAP = {
+    "+": ("<span style='color:green;'>", "</span><br/>\n"),
+    "-": ("<span style='color:red;'>", "</span><br/>\n"),
+}
+WRAP_DEFAULT = ("", "<br/>\n")
+MAX_LINE = 100 # longer diff lines get truncated
+HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+CHUNK_SIZE = 1000 # number of diff lines rendered at once by show_diff()
+MAX_HUNKS = 1000 # number of changed blocks shown in the diff dialog
+# header signature of files written by the running IfcOpenShell version
+WRITER = re.compile(
+    rb"IfcOpenShell v?" + re.escape(ifcopenshell.version.lstrip("v").encode()) + rb"\b"
+)
+
+
+def get_diff(proj, max_hunks=None, as_list=False):
     
-    """Obtains a diff between the current version and the saved version of a project"""
+    """Obtains a diff between the current version and the saved version of a project
+
+    max_hunks: if given, only the changes of the first max_hunks hunks are
+               returned, followed by a line telling how many were left out
+    as_list:   if True, the diff lines are returned as a list instead of a string
+    """
     
     if not proj.FilePath:
         return
-    # cannot use open() here as it gives different encoding 
-    # than ifcopenshell and diff does not work
-    f = ifcopenshell.open(proj.FilePath)
-    old = f.wrapped_data.to_string().split("\n")
-    new = proj.Proxy.ifcfile.wrapped_data.to_string().split("\n")
+    if not getattr(proj, "Modified", True):
+        # nothing changed since the file was loaded or saved
+        return [] if as_list else ""
+    path = proj.FilePath
+    old = get_saved_lines(path, os.path.getmtime(path), os.path.getsize(path))
+    new = proj.Proxy.ifcfile.wrapped_data.to_string().splitlines()
     #diff = difflib.HtmlDiff().make_file(old,new) # UGLY
-    res = [l for l in difflib.unified_diff(old, new, lineterm = "")]
-    res = [l for l in res if l.startswith("+") or l.startswith("-")]
-    res = [l for l in res if not l.startswith("+++") and not l.startswith("---")]
+    # keep only changed lines, skipping hunk headers and context
+    res = []
+    hunks = 0
+    lines = unified_diff(old, new)
+    for l in lines:
+        if l[0] in "+-":
+            res.append(l)
+        elif l[0] == "@":
+            hunks += 1
+            if max_hunks is not None and hunks > max_hunks:
+                # count the remaining hunks, without keeping their lines
+                elided = 1 + sum(1 for l in lines if l[0] == "@")
+                res.append("... ({} additional hunks elided)".format(elided))
+                break
+    if as_list:
+        return res
     return "\n".join(res)
 
 
+@functools.lru_cache(maxsize=2)
+def get_saved_lines(path, mtime, size):
+
+    """Returns the lines of a saved IFC file. Results are cached, the
+    modification time and size are only given to invalidate the cache"""
+
+    # STEP files are plain ASCII, so decoding raw bytes as latin-1 gives
+    # the same text as ifcopenshell, without the encoding issues of open().
+    # The file is memory-mapped so the header can be checked without
+    # reading it all, and the contents are decoded straight from the map
+    with open(path, "rb") as f:
+        if size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if WRITER.search(mm, 0, max(mm.find(b"DATA;"), 0)):
+                    # written by this IfcOpenShell: identical to its serialization
+                    return str(mm, "latin-1").splitlines()
+    # other writers, including other IfcOpenShell versions, can format
+    # entities or numbers differently, reserialize to compare
+    f = ifcopenshell.open(path)
+    return f.wrapped_data.to_string().splitlines()
+
+
+def unified_diff(a, b, n=3):
+
+    """Yields the lines of a unified diff between two lists of lines,
+    without file headers, using the fastest available sequence matcher.
+    Hunk headers follow the same range format as difflib.unified_diff"""
+
+    # strip the common beginning and end, usually the largest part of
+    # the file, so the matcher only works on the changed region
+    start = 0
+    size = min(len(a), len(b))
+    while start < size and a[start] == b[start]:
+        start += 1
+    tail = 0
+    while tail < size - start and a[-1 - tail] == b[-1 - tail]:
+        tail += 1
+    a = a[start:len(a) - tail]
+    b = b[start:len(b) - tail]
+    for group in SequenceMatcher(None, a, b).get_grouped_opcodes(n):
+        first, last = group[0], group[-1]
+        yield "@@ -{} +{} @@".format(
+            format_range(start + first[1], start + last[2]),
+            format_range(start + first[3], start + last[4])
+        )
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                for l in a[i1:i2]:
+                    yield " " + l
+                continue
+            if tag in ("replace", "delete"):
+                for l in a[i1:i2]:
+                    yield "-" + l
+            if tag in ("replace", "insert"):
+                for l in b[j1:j2]:
+                    yield "+" + l
+
+
+def format_range(start, stop):
+
+    """Returns a hunk header range of a unified diff, "line,length" with
+    1-based lines, where an empty range refers to the line before it"""
+
+    length = stop - start
+    if length == 1:
+        return str(start + 1)
+    if not length:
+        # the empty range is placed after the line it follows
+        return "{},0".format(start)
+    return "{},{}".format(start + 1, length)
+
+
 def htmlize(diff):
     
-    """Returns an HTML version of a diff list"""
-
-    diff = diff.split("\n")
-    html = "<html><body>\n"
-    for l in diff:
-        if l.startswith("+"):
-            html += "<span style='color:green;'>" + l[:100] + "</span><br/>\n"
-        elif l.startswith("-"):
-            html += "<span style='color:red;'>" + l[:100] + "</span><br/>\n"
-        else:
-            html += l + "<br/>\n"
-    html += "</body></html>"
-    return html
+    """Returns an HTML version of a diff, given as a string or a list of lines"""
+
+    if isinstance(diff, str):
+        diff = diff.split("\n")
+    buf = io.StringIO()
+    buf.write("<html><body>\n")
+    write_html(diff, buf)
+    buf.write("</body></html>")
+    return buf.getvalue()
+
+
+def htmlize_chunks(diff, size=CHUNK_SIZE):
+
+    """Yields HTML fragments of a diff, given as a string or a list
+    of lines, each covering size lines"""
+
+    if isinstance(diff, str):
+        diff = diff.split("\n")
+    for i in range(0, len(diff), size):
+        buf = io.StringIO()
+        write_html(diff[i:i + size], buf)
+        yield buf.getvalue()
+
+
+def write_html(lines, buf):
+
+    """Writes the HTML version of the given diff lines to a text buffer"""
+
+    # bound once, this loop runs for every changed line of the file
+    write = buf.write
+    wrap = WRAP.get
+    for l in lines:
+        prefix, suffix = wrap(l[:1], WRAP_DEFAULT)
+        write(prefix)
+        # escaped after truncating so no entity gets cut in half
+        write((l if len(l) <= MAX_LINE else l[:MAX_LINE]).translate(HTML_ESCAPE))
+        write(suffix)
+
+
+class diff_signals(QtCore.QObject):
+
+    """Signals emitted by a diff_renderer"""
+
+    chunk = QtCore.Signal(str)
+    finished = QtCore.Signal()
+
+
+class diff_renderer(QtCore.QRunnable):
+
+    """Builds the HTML of a diff in a worker thread, chunk by chunk"""
+
+    def __init__(self, diff):
+
+        super().__init__()
+        self.diff = diff
+        self.cancelled = False
+        # created here so it lives in the GUI thread
+        self.signals = diff_signals()
+
+
+    def run(self):
+
+        for chunk in htmlize_chunks(self.diff):
+            if self.cancelled:
+                return
+            self.signals.chunk.emit(chunk)
+        self.signals.finished.emit()
 
 
 def show_diff(diff):
@@ -69,6 +239,25 @@ def show_diff(diff):
     
     b = os.path.dirname(__file__)
     dlg = FreeCADGui.PySideUic.loadUi(os.path.join(b, "ui", "dialogDiff.ui"))
-    dlg.textEdit.setHtml(htmlize(diff))
+    dlg.textEdit.setPlaceholderText("Generating diff...")
+    cursor = QtGui.QTextCursor(dlg.textEdit.document())
+    renderer = diff_renderer(diff)
+
+    def add_chunk(html):
+        if not renderer.cancelled:
+            cursor.movePosition(QtGui.QTextCursor.End)
+            cursor.insertHtml(html)
+
+    def finish():
+        if not dlg.textEdit.toPlainText().strip():
+            dlg.textEdit.setPlaceholderText("No changes")
+        else:
+            dlg.textEdit.setPlaceholderText("")
+
+    # the HTML is built in a worker thread and appended to the
+    # dialog in the GUI thread as it comes, so the UI never blocks
+    renderer.signals.chunk.connect(add_chunk, QtCore.Qt.QueuedConnection)
+    renderer.signals.finished.connect(finish, QtCore.Qt.QueuedConnection)
+    QtCore.QThreadPool.globalInstance().start(renderer)
     result = dlg.exec_()
-    
+    renderer.cancelled = True
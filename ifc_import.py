@@ -30,6 +30,8 @@ import ifc_tools
 if FreeCAD.GuiUp:
     import FreeCADGui
 
+PARAMS = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/NativeIFC")
+
 
 def open(filename):
 
@@ -47,7 +49,9 @@ def insert(filename, docname, strategy=None, shapemode=None, switchwb=None, sile
 
     """Inserts an IFC document in a FreeCAD document"""
 
-    importlib.reload(ifc_tools)  # useful as long as we are in early dev times
+    if os.environ.get("NATIVEIFC_DEV"):
+        # reload changes made to ifc_tools while developing
+        importlib.reload(ifc_tools)
     strategy, shapemode, switchwb = get_options(strategy, shapemode, switchwb, silent)
     if strategy is None:
         print("Aborted.")
@@ -58,7 +62,8 @@ def insert(filename, docname, strategy=None, shapemode=None, switchwb=None, sile
     document.recompute()
     if FreeCAD.GuiUp:
         FreeCADGui.doCommand("ifcfile = FreeCAD.ActiveDocument.{}.Proxy.ifcfile #warning: make sure you know what you are doing when using this!".format(prj_obj.Name))
-    endtime = "%02d:%02d" % (divmod(round(time.time() - stime, 1), 60))
+    elapsed = int(time.time() - stime)
+    endtime = f"{elapsed // 60:02d}:{elapsed % 60:02d}"
     fsize = round(os.path.getsize(filename)/1048576, 2)
     print ("Imported", os.path.basename(filename), "(", fsize, "Mb ) in", endtime)
     if FreeCAD.GuiUp and switchwb:
@@ -79,33 +84,46 @@ def get_options(strategy=None, shapemode=None, switchwb=None, silent=False):
                2 = all children
     """
 
-    params = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/NativeIFC")
-    if strategy is None:
-        strategy = params.GetInt("ImportStrategy",0)
-    if shapemode is None:
-        shapemode = params.GetInt("ShapeMode",0)
-    if switchwb is None:
-        switchwb = params.GetBool("SwitchWB",True)
+    # read all stored options at once, then apply the given ones
+    stored = {
+        "ImportStrategy": PARAMS.GetInt("ImportStrategy", 0),
+        "ShapeMode": PARAMS.GetInt("ShapeMode", 0),
+        "SwitchWB": PARAMS.GetBool("SwitchWB", True),
+        "AskAgain": PARAMS.GetBool("AskAgain", True),
+    }
+    options = dict(stored)
+    given = {"ImportStrategy": strategy, "ShapeMode": shapemode, "SwitchWB": switchwb}
+    options.update({k: v for k, v in given.items() if v is not None})
+    strategy = options["ImportStrategy"]
+    shapemode = options["ShapeMode"]
+    switchwb = options["SwitchWB"]
     if silent:
         return strategy, shapemode, switchwb
-    ask = params.GetBool("AskAgain",True)
-    if ask and FreeCAD.GuiUp:
+    if options["AskAgain"] and FreeCAD.GuiUp:
         import FreeCADGui
         from PySide import QtGui
         dlg = FreeCADGui.PySideUic.loadUi(os.path.join(os.path.dirname(__file__),"ui","dialogImport.ui"))
         dlg.comboStrategy.setCurrentIndex(strategy)
         dlg.comboShapeMode.setCurrentIndex(shapemode)
         dlg.checkSwitchWB.setChecked(switchwb)
-        dlg.checkAskAgain.setChecked(ask)
+        dlg.checkAskAgain.setChecked(options["AskAgain"])
         result = dlg.exec_()
         if not result:
             return None, None, None
-        strategy = dlg.comboStrategy.currentIndex()
-        shapemode = dlg.comboShapeMode.currentIndex()
-        switchwb = dlg.checkSwitchWB.isChecked()
-        ask = dlg.checkAskAgain.isChecked()
-        params.SetInt("ImportStrategy",strategy)
-        params.SetInt("ShapeMode",shapemode)
-        params.SetBool("SwitchWB",switchwb)
-        params.SetBool("AskAgain",ask)
+        options = {
+            "ImportStrategy": dlg.comboStrategy.currentIndex(),
+            "ShapeMode": dlg.comboShapeMode.currentIndex(),
+            "SwitchWB": dlg.checkSwitchWB.isChecked(),
+            "AskAgain": dlg.checkAskAgain.isChecked(),
+        }
+        # only write the options that changed
+        for key, value in options.items():
+            if value != stored[key]:
+                if isinstance(value, bool):
+                    PARAMS.SetBool(key, value)
+                else:
+                    PARAMS.SetInt(key, value)
+        strategy = options["ImportStrategy"]
+        shapemode = options["ShapeMode"]
+        switchwb = options["SwitchWB"]
     return strategy, shapemode, switchwb
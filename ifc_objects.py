@@ -45,6 +45,10 @@ class ifc_object:
             obj.IfcType = obj.Type
             self.rebuild_classlist(obj, setprops=True)
 
+        # properties are being set from the IFC entity itself
+        if getattr(self, "populating", False):
+            return
+
         # edit an IFC attribute
         if prop == "Schema":
             self.set_schema(obj, obj.Schema)
@@ -138,7 +142,7 @@ class ifc_object:
                 if not obj.ViewObject.Proxy.schema_warning():
                     return
             ifcfile, migration_table = ifc_tools.migrate_schema(ifcfile, schema)
-            self.ifcfile = ifcfile
+            ifc_tools.set_ifcfile(obj, ifcfile)
             obj.Modified = True
             for old_id,new_id in migration_table.items():
                 child = [o for o in obj.OutListRecursive if getattr(o,"StepId",None) == old_id]
@@ -24,12 +24,14 @@ import os
 import time
 import tempfile
 import FreeCAD
+import Part
 import Draft
 import Arch
 import unittest
 import requests
 import ifc_import
 import ifc_tools
+import ifc_diff
 import difflib
 
 IFCOPENHOUSE_IFC4 = "https://github.com/aothms/IfcOpenHouse/raw/master/IfcOpenHouse_IFC4.ifc"
@@ -75,6 +77,31 @@ def compare(file1, file2):
     return res
 
 
+def patch(lines, diff):
+
+    """Applies the lines of a unified diff to a list of lines"""
+
+    res = []
+    pos = 0
+    for l in diff:
+        if l.startswith("@@"):
+            start, _, length = l.split()[1][1:].partition(",")
+            # an empty range refers to the line before it
+            begin = int(start) if length == "0" else int(start) - 1
+            res.extend(lines[pos:begin])
+            pos = begin
+        elif l.startswith("+"):
+            res.append(l[1:])
+        else:
+            if lines[pos] != l[1:]:
+                return None
+            pos += 1
+            if l.startswith(" "):
+                res.append(l[1:])
+    res.extend(lines[pos:])
+    return res
+
+
 class ArchTest(unittest.TestCase):
 
     def setUp(self):
@@ -220,5 +247,41 @@ class ArchTest(unittest.TestCase):
         self.failUnless(fco == 8 and ifco == 12, "CreateDocument failed")
 
 
+    def test10_ShapeCache(self):
 
-
+        FreeCAD.Console.PrintMessage("10. NativeIFC shape cache...")
+        clearObjects()
+        fp = getIfcFilePath()
+        ifc_import.insert(fp, "IfcTest", strategy=0, shapemode=2, switchwb=0, silent=True)
+        proj = FreeCAD.getDocument("IfcTest").Objects[0]
+        ifcfile = ifc_tools.get_ifcfile(proj)
+        walls = ifcfile.by_type("IfcWall")
+        ifc_tools.get_shape(walls, ifcfile)
+        # replace the cached shapes with unit boxes, to tell if they are used
+        cache = ifc_tools.get_cache(ifcfile)
+        for wall in walls:
+            cache["Shape"][wall.id()] = Part.makeBox(1, 1, 1)
+        shape, colors = ifc_tools.get_shape(walls, ifcfile, cached=True)
+        self.failUnless(abs(shape.Volume - len(walls)) < 1e-6, "ShapeCache failed")
+
+
+    def test11_UnifiedDiff(self):
+
+        FreeCAD.Console.PrintMessage("11. NativeIFC diff of trimmed files...")
+        a = ["#{}=IFCWALL('{}');".format(i, i) for i in range(100)]
+        cases = [
+            a[:50] + ["#50=IFCSLAB('50');"] + a[51:], # replaced line
+            a[:30] + a[31:], # deleted line
+            a[:70] + ["#100=IFCDOOR('100');"] + a[70:], # inserted line
+            a + ["#100=IFCDOOR('100');"], # appended line
+            ["#100=IFCDOOR('100');"] + a[:10] + a[20:], # several changes
+            [], # everything deleted
+        ]
+        for b in cases:
+            diff = list(ifc_diff.unified_diff(a, b))
+            self.failUnless(patch(a, diff) == b, "UnifiedDiff failed")
+        # without a common beginning and end, hunks match difflib
+        b = ["#100=IFCDOOR('100');"] + a[1:30] + a[31:99] + ["#101=IFCDOOR('101');"]
+        ref = list(difflib.unified_diff(a, b, lineterm=''))[2:]
+        res = list(ifc_diff.unified_diff(a, b))
+        self.failUnless(res == ref, "UnifiedDiff failed")
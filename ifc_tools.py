@@ -21,7 +21,11 @@
 #***************************************************************************
 
 import os
+import functools
 import multiprocessing
+import weakref
+
+import numpy
 
 import FreeCAD
 from FreeCAD import Base
@@ -40,6 +44,20 @@ import ifc_objects
 import ifc_viewproviders
 
 SCALE = 1000.0 # IfcOpenShell works in meters, FreeCAD works in mm
+DUMMY_SHAPE = Part.makeBox(1,1,1) # placeholder shape for groups, shared by all
+PROXIES = weakref.WeakValueDictionary() # project proxies by id of their ifcfile
+
+# classes never loaded by filter_elements, together with their subclasses
+EXCLUDED_CLASSES = (
+    "IfcFeatureElement", # never load feature elements, they can be lazy loaded
+    "IfcSpace", # do not load spaces for now (TODO handle them correctly)
+    "IfcProject", # skip projects
+    "IfcFurnishingElement", # skip furniture for now, they can be lazy loaded probably
+    "IfcAnnotation", # skip annotations for now
+)
+ITERATOR_MIN = 4 # smaller batches are processed without the geometry iterator
+EXCLUDED_BY_SCHEMA = {} # sets of excluded class names, by schema name
+ATTRIBUTE_DEFINITIONS = {} # attribute definitions, by schema-qualified class name
 
 
 def create_document(document, filename=None, shapemode=0, strategy=0):
@@ -66,7 +84,7 @@ def create_document(document, filename=None, shapemode=0, strategy=0):
     else:
         ifcfile = create_ifcfile()
     project = ifcfile.by_type("IfcProject")[0]
-    obj.Proxy.ifcfile = ifcfile
+    set_ifcfile(obj, ifcfile)
     add_properties(obj, ifcfile, project, shapemode=shapemode)
     obj.addProperty("App::PropertyEnumeration", "Schema", "Base")
     obj.Schema = ifcopenshell.ifcopenshell_wrapper.schema_names()
@@ -125,18 +143,27 @@ def create_children(obj, ifcfile=None, recursive=False, only_structure=False, as
 
     """Creates a hierarchy of objects under an object"""
 
-    def create_child(parent, element):
+    def create_child(parent, element, existing):
+        # existing: the set of stepids of the children of parent
+        # the new child comes first in the result, the caller adds it to parent
         subresult = []
         # do not create if a child with same stepid already exists
-        if not element.id() in [getattr(c,"StepId",0) for c in getattr(parent,"Group",[])]:
+        if not element.id() in existing:
             child = create_object(element, parent.Document, ifcfile, parent.ShapeMode)
             subresult.append(child)
-            parent.addObject(child)
+            existing.add(element.id())
             if element.is_a("IfcSite"):
                 # force-create contained buildings too if we just created a site
                 buildings = [o for o in get_children(child, ifcfile) if o.is_a("IfcBuilding")]
+                child_existing = set()
+                added = []
                 for building in buildings:
-                    subresult.extend(create_child(child, building))
+                    created = create_child(child, building, child_existing)
+                    if created:
+                        added.append(created[0])
+                    subresult.extend(created)
+                if added:
+                    child.addObjects(added)
             if recursive:
                 subresult.extend(create_children(child, ifcfile, recursive, only_structure, assemblies))
         return subresult
@@ -144,8 +171,16 @@ def create_children(obj, ifcfile=None, recursive=False, only_structure=False, as
     if not ifcfile:
         ifcfile = get_ifcfile(obj)
     result = []
+    added = []
+    existing = {getattr(c,"StepId",0) for c in getattr(obj,"Group",[])}
     for child in get_children(obj, ifcfile, only_structure, assemblies):
-        result.extend(create_child(obj, child))
+        created = create_child(obj, child, existing)
+        if created:
+            added.append(created[0])
+        result.extend(created)
+    if added:
+        # grouping all children at once updates the tree view only once
+        obj.addObjects(added)
     return result
 
 
@@ -161,10 +196,8 @@ def get_children(obj, ifcfile, only_structure=False, assemblies=True):
     if not only_structure:
         for rel in getattr(ifcentity, "ContainsElements", []):
             children.extend(rel.RelatedElements)
-        for rel in getattr(ifcentity, "HasOpenings", []):
-            children.extend([rel.RelatedOpeningElement])
-        for rel in getattr(ifcentity, "HasFillings", []):
-            children.extend([rel.RelatedBuildingElement])
+        children.extend(rel.RelatedOpeningElement for rel in getattr(ifcentity, "HasOpenings", []))
+        children.extend(rel.RelatedBuildingElement for rel in getattr(ifcentity, "HasFillings", []))
     return filter_elements(children, ifcfile, expand=False)
 
 
@@ -180,11 +213,20 @@ def get_ifcfile(obj):
         if project.FilePath:
             ifcfile = ifcopenshell.open(project.FilePath)
             if hasattr(project,"Proxy"):
-                project.Proxy.ifcfile = ifcfile
+                set_ifcfile(project, ifcfile)
             return ifcfile
     return None
 
 
+def set_ifcfile(obj, ifcfile):
+
+    """Attaches an ifc file to a project object, with an empty shape cache"""
+
+    obj.Proxy.ifcfile = ifcfile
+    obj.Proxy.ifccache = {"Shape":{},"Color":{},"Coin":{}}
+    PROXIES[id(ifcfile)] = obj.Proxy
+
+
 def get_project(obj):
 
     """Returns the ifcdocument this object belongs to"""
@@ -192,9 +234,23 @@ def get_project(obj):
     proj_types = ("IfcProject","IfcProjectLibrary")
     if getattr(obj, "Type", None) in proj_types:
         return obj
+    # IFC objects remember their project, avoiding the graph walk below
+    proxy = getattr(obj, "Proxy", None)
+    if not isinstance(proxy, ifc_objects.ifc_object):
+        proxy = None
+    project = getattr(proxy, "project", None)
+    if project:
+        try:
+            if getattr(project, "Type", None) in proj_types:
+                return project
+        except Exception:
+            # the project object has been deleted
+            pass
     if hasattr(obj,"InListRecursive"):
         for parent in obj.InListRecursive:
             if getattr(parent, "Type", None) in proj_types:
+                if proxy:
+                    proxy.project = parent
                 return parent
     return None
 
@@ -203,9 +259,8 @@ def can_expand(obj, ifcfile):
 
     """Returns True if this object can have any more child extracted"""
 
-    children = get_children(obj, ifcfile)
-    group = [o.StepId for o in obj.Group]
-    for child in children:
+    group = {o.StepId for o in obj.Group}
+    for child in get_children(obj, ifcfile):
         if child.id() not in group:
             return True
     return False
@@ -216,6 +271,7 @@ def add_object(document, project=False):
     """adds a new object to a FreeCAD document"""
 
     proxy = ifc_objects.ifc_object()
+    proxy.project = None # cached by get_project()
     if project:
         vp = ifc_viewproviders.ifc_vp_document()
     else:
@@ -228,6 +284,21 @@ def add_properties(obj, ifcfile=None ,ifcentity=None, links=False, shapemode=0,
 
     """Adds the properties of the given IFC object to a FreeCAD object"""
 
+    # the values are read from the IFC entity, there is no point
+    # in writing each of them back to it as they get set.
+    # Calls can be nested, so restore the flag rather than clearing it
+    previous = getattr(obj.Proxy, "populating", False)
+    obj.Proxy.populating = True
+    try:
+        populate_properties(obj, ifcfile, ifcentity, links, shapemode, short)
+    finally:
+        obj.Proxy.populating = previous
+
+
+def populate_properties(obj, ifcfile, ifcentity, links, shapemode, short):
+
+    """Creates and sets the properties of a FreeCAD object from an IFC object"""
+
     if not ifcfile:
         ifcfile = get_ifcfile(obj)
     if not ifcentity:
@@ -247,12 +318,14 @@ def add_properties(obj, ifcfile=None ,ifcentity=None, links=False, shapemode=0,
             shapemode = shapemodes[shapemode]
         obj.ShapeMode = shapemodes
         obj.ShapeMode = shapemode
-    attr_defs = ifcentity.wrapped_data.declaration().as_entity().all_attributes()
-    try:
-        info_ifcentity = ifcentity.get_info()
-    except:
-        # slower but no errors
-        info_ifcentity = get_elem_attribs(ifcentity)
+    if short:
+        # only the class and id become properties, don't query the rest
+        attr_defs = {}
+        info_ifcentity = {"id": ifcentity.id(), "type": ifcentity.is_a()}
+    else:
+        attr_defs = get_attribute_definitions(ifcentity)
+        # linked entities are only needed if we create links
+        info_ifcentity = get_elem_attribs(ifcentity, scalar_only=not links)
     for attr, value in info_ifcentity.items():
         if attr == "type":
             attr = "Type"
@@ -262,8 +335,7 @@ def add_properties(obj, ifcfile=None ,ifcentity=None, links=False, shapemode=0,
             continue
         if short and attr not in ("Type","StepId"):
             continue
-        attr_def = next((a for a in attr_defs if a.name() == attr), None)
-        data_type = ifcopenshell.util.attribute.get_primitive_type(attr_def) if attr_def else None
+        attr_def, data_type = attr_defs.get(attr, (None, None))
         if attr == "Type":
             # main enum property, not saved to file
             if attr not in obj.PropertiesList:
@@ -323,6 +395,21 @@ def add_properties(obj, ifcfile=None ,ifcentity=None, links=False, shapemode=0,
                 setattr(obj, attr, str(value))
 
 
+def get_attribute_definitions(ifcentity):
+
+    """Returns a {name: (definition, primitive type)} dictionary of
+    the attributes of the class of an IFC entity. Cached per class"""
+
+    key = ifcentity.is_a(True) # the class name prefixed by its schema
+    if key not in ATTRIBUTE_DEFINITIONS:
+        attr_defs = ifcentity.wrapped_data.declaration().as_entity().all_attributes()
+        ATTRIBUTE_DEFINITIONS[key] = {
+            a.name(): (a, ifcopenshell.util.attribute.get_primitive_type(a))
+            for a in attr_defs
+        }
+    return ATTRIBUTE_DEFINITIONS[key]
+
+
 def remove_unused_properties(obj):
 
     """Remove IFC properties if they are not part of the current IFC class"""
@@ -346,8 +433,16 @@ def get_ifc_classes(obj, baseclass):
     ifcfile = get_ifcfile(obj)
     if not ifcfile:
         return [baseclass]
-    schema = ifcfile.wrapped_data.schema_name()
-    schema = ifcopenshell.ifcopenshell_wrapper.schema_by_name(schema)
+    return list(get_schema_classes(ifcfile.wrapped_data.schema_name(), baseclass))
+
+
+@functools.lru_cache(maxsize=None)
+def get_schema_classes(schema_name, baseclass):
+
+    """Returns a tuple of sibling classes of a class in the given schema.
+    Schemas never change, so results are cached"""
+
+    schema = ifcopenshell.ifcopenshell_wrapper.schema_by_name(schema_name)
     declaration = schema.declaration_by_name(baseclass)
     if "StandardCase" in baseclass:
         declaration = declaration.supertype()
@@ -356,7 +451,7 @@ def get_ifc_classes(obj, baseclass):
     classes.extend([sub.name() for sub in declaration.subtypes()])
     if not baseclass in classes:
         classes.append(baseclass)
-    return classes
+    return tuple(classes)
 
 
 def get_ifc_element(obj):
@@ -403,29 +498,38 @@ def filter_elements(elements, ifcfile, expand=True):
                     # the Polyline is the wall axis
                     # see https://github.com/yorikvanhavre/FreeCAD-NativeIFC/issues/28
                     elements = ifcopenshell.util.element.get_decomposition(elem)
-    # Never load feature elements, they can be lazy loaded
-    elements = [e for e in elements if not e.is_a("IfcFeatureElement")]
-    # do not load spaces for now (TODO handle them correctly)
-    elements = [e for e in elements if not e.is_a("IfcSpace")]
-    # skip projects
-    elements = [e for e in elements if not e.is_a("IfcProject")]
-    # skip furniture for now, they can be lazy loaded probably
-    elements = [e for e in elements if not e.is_a("IfcFurnishingElement")]
-    # skip annotations for now
-    elements = [e for e in elements if not e.is_a("IfcAnnotation")]
+    excluded = get_excluded_classes(ifcfile)
+    elements = [e for e in elements if e.is_a() not in excluded]
     return elements
 
 
+def get_excluded_classes(ifcfile):
+
+    """Returns the names of all the classes skipped by filter_elements,
+    including subclasses, for the schema of the given ifc file"""
+
+    schema = ifcfile.wrapped_data.schema_name()
+    if schema not in EXCLUDED_BY_SCHEMA:
+        declarations = ifcopenshell.ifcopenshell_wrapper.schema_by_name(schema)
+        classes = set()
+        queue = [declarations.declaration_by_name(c) for c in EXCLUDED_CLASSES]
+        while queue:
+            declaration = queue.pop()
+            classes.add(declaration.name())
+            queue.extend(declaration.subtypes())
+        EXCLUDED_BY_SCHEMA[schema] = frozenset(classes)
+    return EXCLUDED_BY_SCHEMA[schema]
+
+
 def get_cache(ifcfile):
 
     """Returns the shape cache dictionary associated with this ifc file"""
 
-    for d in FreeCAD.listDocuments().values():
-        for o in d.Objects:
-            if hasattr(o,"Proxy") and hasattr(o.Proxy,"ifcfile"):
-                if o.Proxy.ifcfile == ifcfile:
-                    if hasattr(o.Proxy,"ifccache") and o.Proxy.ifccache:
-                        return o.Proxy.ifccache
+    proxy = PROXIES.get(id(ifcfile))
+    # the id of a deleted file can be reused by another one
+    if proxy is not None and getattr(proxy, "ifcfile", None) is ifcfile:
+        if getattr(proxy, "ifccache", None):
+            return proxy.ifccache
     return {"Shape":{},"Color":{},"Coin":{}}
 
 
@@ -433,12 +537,9 @@ def set_cache(ifcfile, cache):
 
     """Sets the given dictionary as shape cache for the given ifc file"""
 
-    for d in FreeCAD.listDocuments().values():
-        for o in d.Objects:
-            if hasattr(o,"Proxy") and hasattr(o.Proxy,"ifcfile"):
-                if o.Proxy.ifcfile == ifcfile:
-                    o.Proxy.ifccache = cache
-                    return
+    proxy = PROXIES.get(id(ifcfile))
+    if proxy is not None and getattr(proxy, "ifcfile", None) is ifcfile:
+        proxy.ifccache = cache
 
 
 def get_shape(elements, ifcfile, cached=False):
@@ -455,29 +556,25 @@ def get_shape(elements, ifcfile, cached=False):
     if cached:
         rest = []
         for e in elements:
-            if e.id in cache["Shape"]:
-                s = cache["Shape"][e.id]
+            if e.id() in cache["Shape"]:
+                s = cache["Shape"][e.id()]
                 shapes.append(s.copy())
-                if e.id in cache["Color"]:
-                    c = cache["Color"][e.id]
+                if e.id() in cache["Color"]:
+                    c = cache["Color"][e.id()]
                 else:
                     c = (0.8,0.8,0.8)
-                for f in s.Faces:
-                    colors.append(c)
+                colors.extend([c] * len(s.Faces))
             else:
                 rest.append(e)
         elements = rest
-    if not elements:
-        return shapes, colors
-    progressbar = Base.ProgressIndicator()
-    total = len(elements)
-    progressbar.start("Generating "+str(total)+" shapes...",total)
-    iterator = get_geom_iterator(ifcfile, elements, brep=True)
-    if iterator is None:
-        return None, None
-    while True:
-        item = iterator.get()
-        if item:
+    if elements:
+        progressbar = Base.ProgressIndicator()
+        total = len(elements)
+        progressbar.start("Generating "+str(total)+" shapes...",total)
+        items = get_geom_items(ifcfile, elements, brep=True)
+        if items is None:
+            return None, None
+        for item in items:
             brep = item.geometry.brep_data
             shape = Part.Shape()
             shape.importBrepFromString(brep, False)
@@ -489,19 +586,16 @@ def get_shape(elements, ifcfile, cached=False):
             #color = (color[0], color[1], color[2], 1.0 - color[3])
             # TODO temp workaround for tranparency bug
             color = (color[0], color[1], color[2], 0.0)
-            for f in shape.Faces:
-                colors.append(color)
+            colors.extend([color] * len(shape.Faces))
             cache["Shape"][item.id]=shape
             cache["Color"][item.id]=color
             progressbar.next(True)
-        if not iterator.next():
-            break
-    set_cache(ifcfile, cache)
+        set_cache(ifcfile, cache)
+        progressbar.stop()
     if len(shapes) == 1:
         shape = shapes[0]
     else:
         shape = Part.makeCompound(shapes)
-    progressbar.stop()
     return shape, colors
 
 
@@ -532,41 +626,40 @@ def get_coin(elements, ifcfile, cached=False):
     progressbar = Base.ProgressIndicator()
     total = len(elements)
     progressbar.start("Generating "+str(total)+" shapes...",total)
-    iterator = get_geom_iterator(ifcfile, elements, brep=False)
-    if iterator is None:
+    items = get_geom_items(ifcfile, elements, brep=False)
+    if items is None:
         return None, None
-    while True:
-        item = iterator.get()
-        if item:
-            node = coin.SoSeparator()
-            # colors
-            if item.geometry.materials:
-                color = item.geometry.materials[0].diffuse
-                color = (color[0], color[1], color[2], 0.0)
-                mat = coin.SoMaterial()
-                mat.diffuseColor.setValue(color[:3])
-                # TODO treat transparency
-                #mat.transparency.setValue(0.8)
-                node.addChild(mat)
-            # verts
-            matrix = get_matrix(item.transformation.matrix.data)
-            verts = item.geometry.verts
-            verts = [FreeCAD.Vector(verts[i:i+3]) for i in range(0,len(verts),3)]
-            verts = [tuple(matrix.multVec(v.multiply(SCALE))) for v  in verts]
-            coords = coin.SoCoordinate3()
-            coords.point.setValues(verts)
-            node.addChild(coords)
-            # faces
-            faces = list(item.geometry.faces)
-            faces = [f for i in range(0,len(faces),3) for f in faces[i:i+3]+[-1]]
-            faceset = coin.SoIndexedFaceSet()
-            faceset.coordIndex.setValues(faces)
-            node.addChild(faceset)
-            nodes.addChild(node)
-            cache["Coin"][item.id] = node
-            progressbar.next(True)
-        if not iterator.next():
-            break
+    for item in items:
+        node = coin.SoSeparator()
+        # colors
+        if item.geometry.materials:
+            color = item.geometry.materials[0].diffuse
+            color = (color[0], color[1], color[2], 0.0)
+            mat = coin.SoMaterial()
+            mat.diffuseColor.setValue(color[:3])
+            # TODO treat transparency
+            #mat.transparency.setValue(0.8)
+            node.addChild(mat)
+        # verts, already in world coordinates
+        verts = numpy.array(item.geometry.verts).reshape(-1,3) * SCALE
+        coords = coin.SoCoordinate3()
+        # setValues copies the data into coin. setValuesPointer would
+        # avoid the copy, but coin would then point into a python buffer
+        # that can be freed while the node (or its cached copy) is shown
+        coords.point.setValues(verts.tolist())
+        node.addChild(coords)
+        # faces, each triangle followed by -1
+        triangles = numpy.array(item.geometry.faces, dtype=numpy.int32).reshape(-1,3)
+        faces = numpy.empty((len(triangles),4), dtype=numpy.int32)
+        faces[:,:3] = triangles
+        faces[:,3] = -1
+        faces = faces.ravel().tolist()
+        faceset = coin.SoIndexedFaceSet()
+        faceset.coordIndex.setValues(faces)
+        node.addChild(faceset)
+        nodes.addChild(node)
+        cache["Coin"][item.id] = node
+        progressbar.next(True)
     set_cache(ifcfile, cache)
     progressbar.stop()
     return nodes, None
@@ -581,16 +674,80 @@ def get_settings(ifcfile, brep=True):
         settings.set(settings.DISABLE_TRIANGULATION, True)
         settings.set(settings.USE_BREP_DATA,True)
         settings.set(settings.SEW_SHELLS,True)
-    body_contexts = get_body_context_ids(ifcfile)
+    else:
+        # meshes for display only: get them already placed, and
+        # don't merge coincident vertices, coin doesn't need it
+        settings.set(settings.USE_WORLD_COORDS, True)
+        settings.set(settings.WELD_VERTICES, False)
+    body_contexts = get_body_contexts(ifcfile)
     if body_contexts:
         settings.set_context_ids(body_contexts)
     return settings
 
 
+def get_body_contexts(ifcfile):
+
+    """Returns the body context ids of the given ifc file, stored
+    with its shape cache to scan the file for contexts only once"""
+
+    cache = get_cache(ifcfile)
+    if "BodyContexts" not in cache:
+        cache["BodyContexts"] = get_body_context_ids(ifcfile)
+        set_cache(ifcfile, cache)
+    return cache["BodyContexts"]
+
+
+def get_geom_items(ifcfile, elements, brep):
+
+    """Returns an iterable of the processed geometry of the given elements,
+    or None if the geometry cannot be processed"""
+
+    if len(elements) > ITERATOR_MIN:
+        iterator = get_geom_iterator(ifcfile, elements, brep)
+        if iterator is None:
+            return None
+
+        def iterate():
+            while True:
+                item = iterator.get()
+                if item:
+                    yield item
+                if not iterator.next():
+                    break
+
+        return iterate()
+
+    # starting the multicore iterator costs more than it saves on small batches
+    settings = get_settings(ifcfile, brep)
+    # create_shape() ignores the context ids of the settings,
+    # so pick the body representation like the iterator does
+    body_contexts = get_body_contexts(ifcfile)
+    items = []
+    for element in elements:
+        representation = None
+        if body_contexts:
+            if not element.Representation:
+                continue
+            for rep in element.Representation.Representations:
+                if rep.ContextOfItems.id() in body_contexts:
+                    representation = rep
+                    break
+            else:
+                continue
+        try:
+            items.append(ifcopenshell.geom.create_shape(settings, element, representation))
+        except RuntimeError:
+            # no processable representation, the iterator skips those too
+            pass
+    if not items:
+        return None
+    return items
+
+
 def get_geom_iterator(ifcfile, elements, brep):
 
     settings = get_settings(ifcfile, brep)
-    cores = multiprocessing.cpu_count()
+    cores = min(multiprocessing.cpu_count(), len(elements))
     iterator = ifcopenshell.geom.iterator(settings, ifcfile, cores, include=elements)
     if not iterator.initialize():
         print("  DEBUG: ifc_tools.get_geom_iterator: Invalid iterator")
@@ -622,7 +779,7 @@ def set_geometry(obj, elem, ifcfile, cached=False):
         # workaround for group extension bug: add a dummy placeholder shape)
         # otherwise a shape is force-created from the child shapes
         # and we don't want that otherwise we can't select children
-        obj.Shape = Part.makeBox(1,1,1)
+        obj.Shape = DUMMY_SHAPE
         colors = None
     elif obj.ShapeMode == "Shape":
         # set object shape
@@ -642,10 +799,11 @@ def set_geometry(obj, elem, ifcfile, cached=False):
             # this is for objects that have own coin representation,
             # but shapes among their children and not taken by first if
             # case above. TODO do this more elegantly
-            obj.Shape = Part.makeBox(1,1,1)
+            obj.Shape = DUMMY_SHAPE
         # set coin representation
         node, colors = get_coin([elem], ifcfile, cached)
-        basenode.addChild(node)
+        if node is not None:
+            basenode.addChild(node)
     set_colors(obj, colors)
 
 
@@ -719,12 +877,13 @@ def get_matrix(ios_matrix):
 
     # https://github.com/IfcOpenShell/IfcOpenShell/issues/1440
     # https://pythoncvc.net/?cat=203
-    m_l = list()
-    for i in range(3):
-        line = list(ios_matrix[i::3])
-        line[-1] *= SCALE
-        m_l.extend(line)
-    return FreeCAD.Matrix(*m_l)
+    # ios_matrix holds 4 columns of 3 values, the last one is the translation
+    m = ios_matrix
+    return FreeCAD.Matrix(
+        m[0], m[3], m[6], m[9] * SCALE,
+        m[1], m[4], m[7], m[10] * SCALE,
+        m[2], m[5], m[8], m[11] * SCALE,
+    )
 
 
 def save_ifc(obj, filepath=None):
@@ -851,12 +1010,22 @@ def create_relationship(obj, parent, element, ifcfile):
     return uprel
 
 
-def get_elem_attribs(ifcentity):
+def get_elem_attribs(ifcentity, scalar_only=False):
+
+    """Returns a dictionary with the id, type and attributes of an IFC entity
+
+    scalar_only: if True, attributes pointing to other entities are skipped
+    """
+
+    # ifcentity.get_info() gathers everything in one call to IfcOpenShell
+    try:
+        return ifcentity.get_info(recursive=False, scalar_only=scalar_only)
+    except Exception:
+        pass
 
-    # usually info_ifcentity = ifcentity.get_info() would de the trick
     # the above could raise an unhandled excption on corrupted ifc files in IfcOpenShell
     # see https://github.com/IfcOpenShell/IfcOpenShell/issues/2811
-    # thus workaround
+    # thus workaround, slower but no errors
 
     info_ifcentity = {
         "id": ifcentity.id(),
@@ -274,5 +274,5 @@ class ifc_vp_document(ifc_vp_object):
     def diff(self):
 
         import ifc_diff
-        diff = ifc_diff.get_diff(self.Object)
+        diff = ifc_diff.get_diff(self.Object, max_hunks=ifc_diff.MAX_HUNKS, as_list=True)
         ifc_diff.show_diff(diff)